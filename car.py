@@ -1,6 +1,7 @@
 import pygame
 import random
 from config import *
+from ui_components import get_font, get_panel
 
 class Car:
     """Represents a car in the toll queue"""
@@ -30,11 +31,9 @@ class Car:
         pygame.draw.rect(screen, window_color, (self.x + 33, self.y + 8, 12, 10), border_radius=2)
         
         # Payment display
-        font = pygame.font.SysFont("Arial", FONT_SIZE)
+        font = get_font(FONT_SIZE)
         text = font.render(f"${self.payment}", True, WHITE)
-        text_bg = pygame.Surface((text.get_width() + 4, text.get_height() + 2))
-        text_bg.fill(BLACK)
-        text_bg.set_alpha(150)
+        text_bg = get_panel((text.get_width() + 4, text.get_height() + 2), (*BLACK, 150))
         screen.blit(text_bg, (self.x + 8, self.y + 22))
         screen.blit(text, (self.x + 10, self.y + 23))
 
@@ -0,0 +1,49 @@
+# change_maker.py
+from functools import lru_cache
+from config import *
+
+
+def make_change(amount, coins=COINS):
+    """Return the fewest coins summing to amount, or None if impossible"""
+    return _make_change(amount, tuple(coins))
+
+
+@lru_cache(maxsize=None)
+def _make_change(amount, coins):
+    """Solve one amount with a fresh DP table; results are cached per (amount, coins)"""
+    if amount < 0:
+        return None
+
+    # Bottom-up DP over every sub-amount; works for arbitrary denominations
+    best = [0] + [None] * amount
+    last_coin = [0] * (amount + 1)
+    for value in range(1, amount + 1):
+        for coin in coins:
+            if coin <= value and best[value - coin] is not None:
+                if best[value] is None or best[value - coin] + 1 < best[value]:
+                    best[value] = best[value - coin] + 1
+                    last_coin[value] = coin
+    if best[amount] is None:
+        return None
+
+    # Walk back through the chosen coins, largest first
+    breakdown = []
+    while amount > 0:
+        breakdown.append(last_coin[amount])
+        amount -= last_coin[amount]
+    return tuple(sorted(breakdown, reverse=True))
+
+
+# Every (fee, payment) pair a car can present, solved once at import
+CHANGE_TABLE = {
+    (fee, payment): make_change(payment - fee)
+    for fee in TOLL_FEES
+    for payment in PAYMENTS
+}
+
+
+def get_change(fee, payment):
+    """Look up the optimal coin breakdown for a car's fee and payment"""
+    if (fee, payment) in CHANGE_TABLE:
+        return CHANGE_TABLE[(fee, payment)]
+    return make_change(payment - fee)
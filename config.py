@@ -6,6 +6,11 @@ WINDOW_WIDTH = 900
 WINDOW_HEIGHT = 500
 FPS = 60
 
+# Rendering settings
+# When enabled, the scene is drawn at WINDOW_WIDTH x WINDOW_HEIGHT and
+# scaled to the real window in one step, so resizing never re-lays out the game
+FIXED_RESOLUTION = False
+
 # Car settings
 CAR_WIDTH = 60
 CAR_HEIGHT = 40
@@ -32,6 +37,11 @@ GRID_COLS = 4
 # Game settings
 MAX_QUEUE_VISUAL = 15
 STARTING_LIVES = 3
+SHOW_CHANGE_HINT = True
+
+# Auto-cashier settings (toggle with the A key while playing)
+AUTO_CASHIER_SPAWN_INTERVAL = 5
+AUTO_CASHIER_MAX_PER_FRAME = 50
 
 # Colors
 WHITE = (255, 255, 255)
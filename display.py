@@ -0,0 +1,42 @@
+# display.py
+import pygame
+from config import *
+
+
+class ScaledDisplay:
+    """Fixed logical-resolution render target scaled to the window"""
+
+    def __init__(self, logical_size, window):
+        self.logical_width, self.logical_height = logical_size
+        self.surface = pygame.Surface(logical_size).convert()
+        self.resize(window)
+
+    def resize(self, window):
+        """Recompute the scale mapping for a new window surface"""
+        self.window = window
+        window_width, window_height = window.get_size()
+
+        # Letterbox: keep the aspect ratio and center the scaled scene
+        self.scale = min(window_width / self.logical_width,
+                         window_height / self.logical_height)
+        self.scaled_size = (max(1, int(self.logical_width * self.scale)),
+                            max(1, int(self.logical_height * self.scale)))
+        self.offset = ((window_width - self.scaled_size[0]) // 2,
+                       (window_height - self.scaled_size[1]) // 2)
+        self._inv_scale = 1 / self.scale if self.scale else 0
+
+        # Borders stay black; only the viewport is redrawn every frame
+        window.fill(BLACK)
+        self.viewport = window.subsurface(pygame.Rect(self.offset, self.scaled_size))
+
+    def to_logical(self, pos):
+        """Map a window position back to logical coordinates"""
+        return (int((pos[0] - self.offset[0]) * self._inv_scale),
+                int((pos[1] - self.offset[1]) * self._inv_scale))
+
+    def present(self):
+        """Scale the logical surface onto the window in one step"""
+        if self.scaled_size == (self.logical_width, self.logical_height):
+            self.viewport.blit(self.surface, (0, 0))
+        else:
+            pygame.transform.scale(self.surface, self.scaled_size, self.viewport)
@@ -6,7 +6,8 @@ import pygame
 from collections import deque
 from config import *
 from car import Car
-from ui_components import ParticleSystem, Button
+from change_maker import get_change
+from ui_components import ParticleSystem, Button, get_font, get_panel
 
 
 class TollSimulator:
@@ -17,6 +18,12 @@ class TollSimulator:
         self.window_height = height
         self.queue = deque()
         self.last_spawn = pygame.time.get_ticks()
+        self.spawn_interval = SPAWN_INTERVAL
+        
+        # Auto-cashier mode
+        self.auto_cashier = False
+        self.auto_start = 0
+        self.auto_served = 0
         
         # Game state
         self.score = 0
@@ -66,7 +73,20 @@ class TollSimulator:
         self.game_over = False
         self.streak = 0
         self.particles.clear()
+        self.auto_cashier = False
+        self.spawn_interval = SPAWN_INTERVAL
         self.last_spawn = pygame.time.get_ticks()
+        self.auto_start = self.last_spawn
+        self.auto_served = 0
+
+    def toggle_auto_cashier(self):
+        """Switch between manual play and machine-speed auto-cashier"""
+        self.auto_cashier = not self.auto_cashier
+        self.spawn_interval = AUTO_CASHIER_SPAWN_INTERVAL if self.auto_cashier else SPAWN_INTERVAL
+        self.user_input = 0
+        self.last_spawn = pygame.time.get_ticks()
+        self.auto_start = self.last_spawn
+        self.auto_served = 0
 
     def update_button_positions(self):
         """Update positions of all UI buttons"""
@@ -104,11 +124,29 @@ class TollSimulator:
     def spawn_car(self):
         """Spawn a new car if enough time has passed"""
         now = pygame.time.get_ticks()
-        if now - self.last_spawn > SPAWN_INTERVAL:
+        if self.auto_cashier:
+            # Catch up on every arrival since last frame, carrying the remainder
+            # forward so the arrival rate stays exact at sub-frame intervals
+            count = (now - self.last_spawn) // self.spawn_interval
+            for _ in range(count):
+                self.queue.append(Car(self.LANE_Y))
+            self.last_spawn += count * self.spawn_interval
+        elif now - self.last_spawn > self.spawn_interval:
             car = Car(self.LANE_Y)
             self.queue.append(car)
             self.last_spawn = now
 
+    def auto_serve(self):
+        """Serve queued cars at machine speed using the optimal coin breakdown"""
+        for _ in range(AUTO_CASHIER_MAX_PER_FRAME):
+            if not self.queue or self.game_over:
+                break
+            front_car = self.queue[0]
+            breakdown = get_change(front_car.fee, front_car.payment) or ()
+            self.user_input = sum(breakdown)
+            self.check_change()
+            self.auto_served += 1
+
     def handle_click(self, pos):
         """Handle mouse click on buttons"""
         # Coin buttons
@@ -138,16 +176,20 @@ class TollSimulator:
         correct_change = front_car.payment - front_car.fee
         
         if self.user_input == correct_change:
-            self.score += 1
-            self.streak += 1
-            self.particles.add_particles(self.TOLL_X + TOLL_WIDTH // 2, self.LANE_Y, GREEN)
-            self.cash_sound.play()
+            # Machine-served cars are counted in auto_served, not the player's score
+            if not self.auto_cashier:
+                self.score += 1
+                self.streak += 1
+                self.particles.add_particles(self.TOLL_X + TOLL_WIDTH // 2, self.LANE_Y, GREEN)
+                self.cash_sound.play()
             
         else:
             self.lives -= 1
             self.streak = 0
-            self.particles.add_particles(self.TOLL_X + TOLL_WIDTH // 2, self.LANE_Y, RED)
-            self.wrong_sound.play()
+            # Skip effects in auto-cashier so throughput measures the pipeline, not the mixer
+            if not self.auto_cashier:
+                self.particles.add_particles(self.TOLL_X + TOLL_WIDTH // 2, self.LANE_Y, RED)
+                self.wrong_sound.play()
         
         self.queue.popleft()
         self.user_input = 0
@@ -160,6 +202,9 @@ class TollSimulator:
 
     def update(self):
         """Update game state"""
+        if self.auto_cashier:
+            self.auto_serve()
+        
         # Update car movements
         for i, car in enumerate(self.queue):
             if i == 0:
@@ -175,7 +220,8 @@ class TollSimulator:
         self.particles.update()
         
         # Check for game over
-        if len(self.queue) >= MAX_QUEUE_VISUAL:
+        # A backlog in auto-cashier is a throughput reading, not a lost game
+        if len(self.queue) >= MAX_QUEUE_VISUAL and not self.auto_cashier:
             self.fah_sound.play()
             self.over_sound.play()
             self.game_over = True
@@ -205,7 +251,7 @@ class TollSimulator:
                         (self.TOLL_X, self.LANE_Y - 60, TOLL_WIDTH, CAR_HEIGHT + 20), 
                         3, border_radius=8)
         
-        font = pygame.font.SysFont("Arial", FONT_SIZE)
+        font = get_font(FONT_SIZE)
         booth_text = font.render("TOLL", True, WHITE)
         screen.blit(booth_text, (self.TOLL_X + 20, self.LANE_Y - 50))
         
@@ -224,12 +270,11 @@ class TollSimulator:
 
     def _draw_score_panel(self, screen):
         """Draw the score information panel"""
-        info_bg = pygame.Surface((300, 80), pygame.SRCALPHA)
-        pygame.draw.rect(info_bg, (*PANEL_BG, 200), (0, 0, 300, 80), border_radius=10)
+        info_bg = get_panel((300, 80), (*PANEL_BG, 200), border_radius=10)
         screen.blit(info_bg, (10, 10))
         
-        font = pygame.font.SysFont("Arial", FONT_SIZE)
-        subtitle_font = pygame.font.SysFont("Arial", SUBTITLE_FONT_SIZE)
+        font = get_font(FONT_SIZE)
+        subtitle_font = get_font(SUBTITLE_FONT_SIZE)
         
         score_text = font.render(f"Score: {self.score}", True, WHITE)
         lives_text = font.render(f"Lives: {'❤' * self.lives}", True, RED)
@@ -238,6 +283,15 @@ class TollSimulator:
         screen.blit(score_text, (20, 20))
         screen.blit(lives_text, (20, 45))
         screen.blit(streak_text, (160, 20))
+        
+        if self.auto_cashier:
+            seconds = max(1, pygame.time.get_ticks() - self.auto_start) / 1000
+            saturated = len(self.queue) >= MAX_QUEUE_VISUAL
+            auto_label = f"AUTO {self.auto_served / seconds:.0f}/s"
+            if saturated:
+                auto_label += f" q{len(self.queue)}"
+            auto_text = font.render(auto_label, True, RED if saturated else GREEN)
+            screen.blit(auto_text, (160, 50))
 
     def _draw_control_panel(self, screen):
         """Draw the control panel with payment info and buttons"""
@@ -276,8 +330,8 @@ class TollSimulator:
         box_height = 38
         box_spacing = 8
         
-        value_font = pygame.font.SysFont("Arial", 22, bold=True)
-        label_font = pygame.font.SysFont("Arial", 12)
+        value_font = get_font(22, bold=True)
+        label_font = get_font(12)
         
         # Payment box
         payment_x = info_x
@@ -307,7 +361,16 @@ class TollSimulator:
         screen.blit(change_value, (change_x + box_width // 2 - change_value.get_width() // 2, info_y + 13))
         
         # Required change hint
-        font = pygame.font.SysFont("Arial", FONT_SIZE)
+        font = get_font(FONT_SIZE)
         required_text = font.render(f"(Need: ${required_change})", True, (150, 255, 150))
         screen.blit(required_text, (info_x + 10, info_y + box_height + 5))
+        
+        # Optimal coin breakdown hint
+        if SHOW_CHANGE_HINT and self.queue:
+            breakdown = get_change(fee, cash)
+            if breakdown:
+                hint = " + ".join(f"${coin}" for coin in breakdown)
+                hint_text = label_font.render(f"Hint: {hint}", True, (150, 255, 150))
+                screen.blit(hint_text, (info_x + 20 + required_text.get_width(),
+                                        info_y + box_height + 5 + (required_text.get_height() - hint_text.get_height()) // 2))
 
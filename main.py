@@ -4,6 +4,7 @@ import sys
 from config import *
 from game_logic import TollSimulator
 from ui_components import Button
+from display import ScaledDisplay
 
 
 pygame.mixer.init()
@@ -22,6 +23,11 @@ def main():
     pygame.display.set_caption("Toll Gate Queue Simulator")
     clock = pygame.time.Clock()
     
+    # Render target: the window itself, or a fixed logical surface scaled to it
+    render_target = ScaledDisplay((WINDOW_WIDTH, WINDOW_HEIGHT), screen) if FIXED_RESOLUTION else None
+    canvas = render_target.surface if render_target else screen
+    overlay = make_overlay(canvas.get_size())
+    
     # Initialize fonts
     title_font = pygame.font.SysFont("Arial", TITLE_FONT_SIZE, bold=True)
     subtitle_font = pygame.font.SysFont("Arial", SUBTITLE_FONT_SIZE)
@@ -31,6 +37,10 @@ def main():
     game = TollSimulator(WINDOW_WIDTH, WINDOW_HEIGHT)
     background_game = TollSimulator(WINDOW_WIDTH, WINDOW_HEIGHT)
     in_main_menu = True
+    if render_target:
+        # Layouts are computed once at logical size and never rebuilt
+        game.update_button_positions()
+        background_game.update_button_positions()
     
     # Menu buttons
     start_button = Button(pygame.Rect(WINDOW_WIDTH // 2 - 150, WINDOW_HEIGHT // 2 - 25, 300, 60),
@@ -44,6 +54,8 @@ def main():
     while True:
         clock.tick(FPS)
         mouse_pos = pygame.mouse.get_pos()
+        if render_target:
+            mouse_pos = render_target.to_logical(mouse_pos)
         
         
         # Event handling
@@ -54,47 +66,57 @@ def main():
                 
             if event.type == pygame.VIDEORESIZE:
                 screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
-                game.resize(event.w, event.h)
-                background_game.resize(event.w, event.h)
-                start_button.rect.center = (event.w // 2, event.h // 2)
-                try_again_button.rect.center = (event.w // 2, event.h // 2 + 75)
-                quit_button.rect.center = (event.w // 2, event.h // 2 + 150)
+                if render_target:
+                    render_target.resize(screen)
+                else:
+                    canvas = screen
+                    overlay = make_overlay(canvas.get_size())
+                    game.resize(event.w, event.h)
+                    background_game.resize(event.w, event.h)
+                    start_button.rect.center = (event.w // 2, event.h // 2)
+                    try_again_button.rect.center = (event.w // 2, event.h // 2 + 75)
+                    quit_button.rect.center = (event.w // 2, event.h // 2 + 150)
+                
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_a:
+                if not in_main_menu and not game.game_over:
+                    game.toggle_auto_cashier()
                 
             if event.type == pygame.MOUSEBUTTONDOWN:
+                click_pos = render_target.to_logical(event.pos) if render_target else event.pos
                 if in_main_menu:
-                    if start_button.is_clicked(event.pos):
+                    if start_button.is_clicked(click_pos):
                         start_sound.play()
                         in_main_menu = False
                         game.reset_game()
                 elif game.game_over:
-                    if try_again_button.is_clicked(event.pos):
+                    if try_again_button.is_clicked(click_pos):
                         game.reset_game()
                         game.start_sound.stop()
                         game.over_sound.stop()
                         game.fah_sound.stop()
                         game.start_sound.play()
-                    elif quit_button.is_clicked(event.pos):
+                    elif quit_button.is_clicked(click_pos):
                         in_main_menu = True
                         game.start_sound.stop()
                         game.over_sound.stop()
                         game.fah_sound.stop()
                         background_game.reset_game()
                 else:
-                    game.handle_click(event.pos)
+                    game.handle_click(click_pos)
         
         # Main Menu
         if in_main_menu:
-            draw_main_menu(screen, background_game, start_button, game.high_score, 
+            draw_main_menu(canvas, background_game, overlay, start_button, game.high_score, 
                           mouse_pos, title_font, subtitle_font)
-            pygame.display.flip()
+            present(render_target)
             continue
         
         
         # Game Over Screen
         if game.game_over:
-            draw_game_over(screen, game, try_again_button, quit_button, 
+            draw_game_over(canvas, game, try_again_button, quit_button, 
                           mouse_pos, title_font, subtitle_font, font)
-            pygame.display.flip()
+            present(render_target)
             continue
         
         # Gameplay
@@ -107,11 +129,25 @@ def main():
         game.submit_btn.update_hover(mouse_pos)
         game.reset_btn.update_hover(mouse_pos)
         
-        game.draw(screen)
-        pygame.display.flip()
+        game.draw(canvas)
+        present(render_target)
+
+
+def present(render_target):
+    """Scale the logical surface to the window if needed, then flip"""
+    if render_target:
+        render_target.present()
+    pygame.display.flip()
 
 
-def draw_main_menu(screen, background_game, start_button, high_score, 
+def make_overlay(size):
+    """Build the semi-transparent main menu overlay for one canvas size"""
+    overlay = pygame.Surface(size, pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, 160))
+    return overlay
+
+
+def draw_main_menu(screen, background_game, overlay, start_button, high_score, 
                    mouse_pos, title_font, subtitle_font):
     """Draw the main menu with animated background"""
     # Animated background
@@ -120,8 +156,6 @@ def draw_main_menu(screen, background_game, start_button, high_score,
     background_game.draw(screen)
     
     # Semi-transparent overlay
-    overlay = pygame.Surface((screen.get_width(), screen.get_height()), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 160))
     screen.blit(overlay, (0, 0))
     
     # Title with shadow
@@ -1,6 +1,30 @@
 import pygame
 from config import *
 import random
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_font(size, bold=False):
+    """Return a cached Arial font so draw calls don't rebuild it every frame"""
+    return pygame.font.SysFont("Arial", size, bold=bold)
+
+
+@lru_cache(maxsize=None)
+def get_panel(size, color, border_radius=0):
+    """Return a cached translucent rectangle surface of the given size and RGBA color"""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(surface, color, (0, 0, *size), border_radius=border_radius)
+    return surface
+
+
+@lru_cache(maxsize=None)
+def get_particle(color, alpha):
+    """Return a cached particle dot for one color and fade level"""
+    surface = pygame.Surface((6, 6), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (*color, alpha), (3, 3), 3)
+    return surface
+
 
 class Button:
     """Represents a clickable button with hover effect"""
@@ -18,7 +42,7 @@ class Button:
         pygame.draw.rect(screen, color, self.rect, border_radius=8)
         pygame.draw.rect(screen, BLACK, self.rect, 3, border_radius=8)
         
-        font = pygame.font.SysFont("Arial", FONT_SIZE)
+        font = get_font(FONT_SIZE)
         txt = font.render(str(self.text), True, BLACK)
         txt_rect = txt.get_rect(center=self.rect.center)
         screen.blit(txt, txt_rect)
@@ -64,10 +88,7 @@ class ParticleSystem:
         """Draw all particles"""
         for p in self.particles:
             alpha = int(255 * (p['life'] / 60))
-            color = (*p['color'], alpha)
-            s = pygame.Surface((6, 6), pygame.SRCALPHA)
-            pygame.draw.circle(s, color, (3, 3), 3)
-            screen.blit(s, (int(p['x']), int(p['y'])))
+            screen.blit(get_particle(p['color'], alpha), (int(p['x']), int(p['y'])))
 
     def clear(self):
         """Clear all particles"""